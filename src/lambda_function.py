@@ -1,43 +1,119 @@
-import requests
-import os
+import urllib3
 import urllib.parse
+import os
 import json
 import logging
-import boto3
-from botocore.exceptions import ClientError
+import functools
+import time
+
+# Use orjson for Overseerr payloads when it's bundled in the deployment package
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
 
-# Set up logging
+    def json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Set up logging on the root logger, which the Lambda runtime has already configured
 LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
-logging.basicConfig(level=LOG_LEVEL)
-logger = logging.getLogger(__name__)
+logger = logging.getLogger()
+logger.setLevel(LOG_LEVEL)
+
+# DynamoDB client, created on first use so boto3 is only imported on a config cache miss
+dynamodb = None
+
+def get_dynamodb_client():
+    global dynamodb
+    if dynamodb is None:
+        import boto3
+        from botocore.config import Config
+
+        # Keep the pooled connection alive between invocations
+        dynamodb_config = Config(
+            tcp_keepalive=True,
+            max_pool_connections=4,
+            retries={'max_attempts': 2, 'mode': 'standard'},
+            connect_timeout=1,
+            read_timeout=2
+        )
+        dynamodb = boto3.client('dynamodb', region_name=os.environ.get('DYNAMODB_PERSISTENCE_REGION'), config=dynamodb_config)
+    return dynamodb
+
+# Local cache of the DynamoDB config, reused if module init runs again in the same execution environment
+CONFIG_CACHE_PATH = '/tmp/overseerr_cfg.json'
+CONFIG_CACHE_TTL = 3600
+
+def load_cached_config():
+    try:
+        if not os.path.exists(CONFIG_CACHE_PATH):
+            return None
+        if time.time() - os.path.getmtime(CONFIG_CACHE_PATH) > CONFIG_CACHE_TTL:
+            logger.debug("Cached config has expired")
+            return None
+        with open(CONFIG_CACHE_PATH) as f:
+            cached = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read cached config: {e}")
+        return None
 
-# Initialize DynamoDB client
-dynamodb = boto3.client('dynamodb', region_name=os.environ.get('DYNAMODB_PERSISTENCE_REGION'))
+    if isinstance(cached, dict) and cached.get('OVERSEERR_URL') and cached.get('OVERSEERR_API_KEY'):
+        return cached
+    return None
+
+def save_cached_config(config):
+    # The file holds the API key, so keep it owner-only and swap it into place so a partial write is never read back
+    tmp_path = CONFIG_CACHE_PATH + '.tmp'
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # O_CREAT's mode doesn't apply to a leftover temp file
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(config, f)
+        os.replace(tmp_path, CONFIG_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Failed to write cached config: {e}")
 
 # Function to fetch configuration from DynamoDB
 def fetch_config_from_dynamodb():
+    cached = load_cached_config()
+    if cached:
+        logger.debug("Using cached config from %s", CONFIG_CACHE_PATH)
+        return cached
+
     table_name = os.environ.get('DYNAMODB_PERSISTENCE_TABLE_NAME')
     if not table_name:
         raise ValueError("DYNAMODB_PERSISTENCE_TABLE_NAME environment variable is not set")
 
     # Set the key for the DynamoDB query
     key = {'id': {'S': 'amzn1.ask.account.AMAQOAHY55IP7CPFL4DXCPGBE3AHFF4ZGV7RULCMEE2ON2QUYDMSJIKOUEKN6DDIRFD5S46WSHAQCKZMWSCROSQEFWUZHEZBVJVSU7TTEHGHXTE6KL3VFCZYFFNOTQI6ZOWBWCWANBO2JMWLKZ2VG3WA25MM6JW2263BWJVQ5Z3H7ZV4BYFTIOIPESELENYSGRPQNEMHV7TWQVXMARYJJVJ4TH5FVW7RA2GMFH6TD27A'}}
-    logger.debug(f"Fetching config from DynamoDB table '{table_name}' with key: {key}")
+    logger.debug("Fetching config from DynamoDB table '%s' with key: %s", table_name, key)
+
+    from botocore.exceptions import BotoCoreError, ClientError
 
     try:
-        response = dynamodb.get_item(TableName=table_name, Key=key)
+        response = get_dynamodb_client().get_item(TableName=table_name, Key=key)
         item = response.get('Item', {})
-        logger.debug(f"DynamoDB response: {item}")
-        return {
+        logger.debug("DynamoDB response: %s", item)
+        config = {
             'OVERSEERR_URL': item.get('OVERSEERR_URL', {}).get('S'),
             'OVERSEERR_API_KEY': item.get('OVERSEERR_API_KEY', {}).get('S')
         }
-    except ClientError as e:
+        if config['OVERSEERR_URL'] and config['OVERSEERR_API_KEY']:
+            save_cached_config(config)
+        return config
+    except (BotoCoreError, ClientError) as e:
         logger.error(f"Failed to fetch config from DynamoDB: {e}")
         return {}
 
-# Fetch configuration
-config = fetch_config_from_dynamodb()
+# Fetch configuration from DynamoDB only when the environment doesn't already provide it,
+# so env-configured deployments never import boto3
+if os.environ.get('OVERSEERR_URL') and os.environ.get('OVERSEERR_API_KEY'):
+    config = {}
+else:
+    config = fetch_config_from_dynamodb()
 
 # Get Overseerr API details, prioritizing environment variables
 OVERSEERR_URL = os.environ.get('OVERSEERR_URL', config.get('OVERSEERR_URL'))
@@ -52,6 +128,80 @@ if not OVERSEERR_API_KEY:
     logger.error("I can't find the API key. Please set the OVERSEERR_API_KEY environment variable or configure it in DynamoDB.")
     raise ValueError("Missing OVERSEERR_API_KEY configuration")
 
+# Reuse one connection pool so warm invocations skip the TCP/TLS handshake
+POOL = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=4,
+    headers={
+        'X-Api-Key': OVERSEERR_API_KEY,
+        'Content-Type': 'application/json',
+        # requests asked for compressed responses by default; urllib3 doesn't
+        'Accept-Encoding': 'gzip, deflate'
+    },
+    retries=urllib3.Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504], raise_on_status=False),
+    # Connect and read timeouts for Overseerr API calls
+    timeout=urllib3.Timeout(connect=3, read=10)
+)
+
+class OverseerrResponseError(urllib3.exceptions.HTTPError):
+    def __init__(self, response, message=None):
+        super().__init__(message or f"{response.status} Error: {response.reason}")
+        self.response = response
+
+def raise_for_status(response):
+    if response.status >= 400:
+        raise OverseerrResponseError(response)
+
+# A non-JSON reply (e.g. a proxy login page) goes through the same error path as an HTTP error
+def parse_json(response):
+    try:
+        return json_loads(response.data)
+    except ValueError as e:
+        raise OverseerrResponseError(response, f"Invalid JSON response: {e}")
+
+# Overseerr API endpoints
+SEARCH_URL = f"{OVERSEERR_URL}/api/v1/search"
+DETAIL_URL_PREFIX = f"{OVERSEERR_URL}/api/v1/"
+REQUEST_URL = f"{OVERSEERR_URL}/api/v1/request"
+
+# Open the Overseerr connection during init so the first request doesn't pay for the handshake
+try:
+    POOL.request('GET', f"{OVERSEERR_URL}/api/v1/status", retries=False, timeout=2)
+except urllib3.exceptions.HTTPError as e:
+    logger.warning(f"Failed to warm up the Overseerr connection: {e}")
+
+class NoSearchResultsError(Exception):
+    pass
+
+# Search results are cached per title so repeat requests on a warm container skip the search call.
+# Empty results raise instead of returning, so lru_cache never stores them and the title is searched again next time.
+@functools.lru_cache(maxsize=256)
+def search_media(media_title):
+    search_params = {
+        'query': media_title,
+        'page': 1,
+        'language': 'en'
+    }
+
+    logger.debug("Searching for '%s' at %s", media_title, SEARCH_URL)
+    # Overseerr rejects query values with a bare '+', so percent-encode spaces as %20 rather than form-encoding them
+    search_response = POOL.request('GET', SEARCH_URL + '?' + urllib.parse.urlencode(search_params, quote_via=urllib.parse.quote))
+    raise_for_status(search_response)
+    search_data = parse_json(search_response)
+
+    # Select the first matching item
+    if not search_data['results']:
+        raise NoSearchResultsError(media_title)
+
+    selected_item = search_data['results'][0]
+    media_type = selected_item['mediaType']
+    title_key = 'name' if media_type == 'tv' else 'title'
+    logger.debug("Selected item: %s (Type: %s)", selected_item[title_key], media_type)
+    return media_type, selected_item['id']
+
+# Slot values Alexa sends for a spoken "true"
+TRUE_SLOT_VALUES = frozenset(('true', 'True', 'TRUE'))
+
 def lambda_handler(event, context):
     # Log the userId for debugging purposes
     user_id = event['context']['System']['user']['userId']
@@ -63,53 +213,31 @@ def lambda_handler(event, context):
 
     # Extract parameters from the intent
     intent = event['request']['intent']
-    slots = intent.get('slots', {})
-    media_title = slots.get('MediaTitle', {}).get('value', '')
-    request_all_seasons = slots.get('all', {}).get('value', 'false').lower() == 'true'
+    slots = intent.get('slots') or {}
+    media_title_slot = slots.get('MediaTitle')
+    media_title = media_title_slot.get('value', '') if media_title_slot else ''
+    all_slot = slots.get('all')
+    request_all_seasons = bool(all_slot) and all_slot.get('value') in TRUE_SLOT_VALUES
 
     if not media_title:
         return build_response("Please provide the title of the movie or TV show.")
 
-    encoded_query = urllib.parse.quote(media_title)
-
-    # Set up headers for API requests
-    headers = {
-        'X-Api-Key': OVERSEERR_API_KEY,
-        'Content-Type': 'application/json'
-    }
-
     try:
         # Step 1: Search for the media
-        search_url = f"{OVERSEERR_URL}/api/v1/search"
-        search_params = {
-            'query': encoded_query,
-            'page': 1,
-            'language': 'en'
-        }
-        
-        logger.debug(f"Searching for '{media_title}' at {search_url}")
-        search_response = requests.get(search_url, params=search_params, headers=headers)
-        search_response.raise_for_status()
-        search_data = search_response.json()
-
-        # Select the first matching item
-        if not search_data['results']:
+        try:
+            media_type, media_id = search_media(media_title)
+        except NoSearchResultsError:
             return build_response(f"I'm sorry, but I couldn't find any media matching '{media_title}'.")
-
-        selected_item = search_data['results'][0]
-        media_type = selected_item['mediaType']
         title_key = 'name' if media_type == 'tv' else 'title'
-        logger.debug(f"Selected item: {selected_item[title_key]} (Type: {media_type})")
-        
+
         # Step 2: Get detailed information about the media
-        detail_url = f"{OVERSEERR_URL}/api/v1/{media_type}/{selected_item['id']}"
-        logger.debug(f"Fetching details from {detail_url}")
-        detail_response = requests.get(detail_url, headers=headers)
-        detail_response.raise_for_status()
-        detail_data = detail_response.json()
+        detail_url = DETAIL_URL_PREFIX + media_type + '/' + str(media_id)
+        logger.debug("Fetching details from %s", detail_url)
+        detail_response = POOL.request('GET', detail_url)
+        raise_for_status(detail_response)
+        detail_data = parse_json(detail_response)
 
         # Step 3: Prepare the request data for Overseerr
-        request_url = f"{OVERSEERR_URL}/api/v1/request"
         request_data = {
             'mediaType': media_type,
             'mediaId': detail_data['id'],
@@ -123,32 +251,32 @@ def lambda_handler(event, context):
 
         # Handle seasons for TV shows
         if media_type == 'tv':
-            seasons = detail_data.get('seasons', [])
-            if seasons:
+            # Skip season 0 (usually specials)
+            season_numbers = [season['seasonNumber'] for season in detail_data.get('seasons', []) if season.get('seasonNumber')]
+            if season_numbers:
                 if request_all_seasons:
-                    # Request all seasons except season 0 (usually specials)
-                    request_data['seasons'] = [season['seasonNumber'] for season in seasons if season['seasonNumber'] != 0]
+                    request_data['seasons'] = season_numbers
                 else:
                     # Request only the latest season
-                    latest_season = max(season['seasonNumber'] for season in seasons if season['seasonNumber'] != 0)
-                    request_data['seasons'] = [latest_season]
+                    request_data['seasons'] = [max(season_numbers)]
             else:
                 # If no season information is available, request all seasons
                 request_data['seasons'] = 'all'
         
-        logger.debug(f"Sending request to {request_url}")
-        logger.debug(f"Request data: {json.dumps(request_data, indent=2)}")
+        logger.debug("Sending request to %s", REQUEST_URL)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request data: %s", json.dumps(request_data, indent=2))
 
         # Send the request to Overseerr
-        request_response = requests.post(request_url, json=request_data, headers=headers)
-        request_response.raise_for_status()
+        request_response = POOL.request('POST', REQUEST_URL, body=json_dumps(request_data))
+        raise_for_status(request_response)
         
         logger.debug("Request was successful")
         
         # Use the correct key for the title based on the media type
         title = detail_data.get(title_key)
 
-        if request_response.status_code == 201:
+        if request_response.status == 201:
             if media_type == 'tv':
                 if request_all_seasons:
                     return build_response(f"I have successfully added all seasons of '{title}' to your requests.")
@@ -160,12 +288,13 @@ def lambda_handler(event, context):
             logger.error("Failed to add request. Please check the details and try again.")
             return build_response("I couldn't add your request. Please check the details and try again.")
 
-    except requests.exceptions.RequestException as e:
+    except urllib3.exceptions.HTTPError as e:
         error_message = f"An error occurred: {e}"
         logger.error(error_message)
         if hasattr(e, 'response'):
-            logger.error(f"Server response: {e.response.text}")
-            error_message += f" Server response: {e.response.text}"
+            response_text = e.response.data.decode('utf-8', 'replace')
+            logger.error(f"Server response: {response_text}")
+            error_message += f" Server response: {response_text}"
         return build_response(error_message)
 
 def build_response(output):